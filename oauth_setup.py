@@ -9,6 +9,11 @@ import os
 from dotenv import load_dotenv
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json still works
+    orjson = None
+
 SCOPE = ["https://www.googleapis.com/auth/gmail.send"]
 
 
@@ -43,8 +48,12 @@ def main() -> None:
         "client_secret": client_secret,
     }
 
-    with open("oauth_token.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(output, ensure_ascii=False, indent=2).encode("utf-8")
+    with open("oauth_token.json", "wb") as f:
+        f.write(payload)
 
     print("Saved oauth_token.json")
     print("Use refresh_token value in GOOGLE_REFRESH_TOKEN")
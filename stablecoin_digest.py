@@ -8,20 +8,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import functools
+import heapq
 import html
+import io
+import json
+import operator
 import os
 import re
 import smtplib
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import feedparser
+import requests
 from dateutil import parser as dt_parser
 from dotenv import load_dotenv
 
+try:
+    import fastfeedparser
+except ImportError:  # optional fast path; plain feedparser still works
+    fastfeedparser = None
+
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json still works
+    orjson = None
+
 TASK_NAME = "google_news_stablecoin_daily_digest"
 DEFAULT_RSS_URL_KR = (
     "https://news.google.com/rss/search?"
@@ -33,16 +52,84 @@ KEYWORD_KR = "스테이블코인"
 KEYWORD_US = "stablecoin"
 GMAIL_SMTP_HOST = "smtp.gmail.com"
 GMAIL_SMTP_PORT = 587
+RSS_CACHE_FILE = ".rss_cache.json"
+RSS_FETCH_TIMEOUT = 30
+RSS_USER_AGENT = "google-news-stablecoin-daily-digest/1.0"
+
+# Shared session: keep-alive saves a TLS handshake when both feeds hit
+# news.google.com, and gzip/deflate shrinks the RSS body several-fold.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": RSS_USER_AGENT, "Accept-Encoding": "gzip, deflate"})
 WEEKDAY_KR = ["월", "화", "수", "목", "금", "토", "일"]
 
+def _minify_html(template: str) -> str:
+    """Collapse template indentation/newlines and CSS padding whitespace.
+
+    Runs once at import; the minified shell is what every outgoing email
+    carries, so the savings compound across the base64 MIME payload.
+    """
+    template = re.sub(r"\s+", " ", template).strip()
+    for src, dst in (("> ", ">"), (" {", "{"), ("{ ", "{"), ("} ", "}"), (" }", "}"), ("; ", ";"), (": ", ":"), (", ", ",")):
+        template = template.replace(src, dst)
+    return template
+
+
+# Static newsletter shell, minified once at import time. Only the hero text
+# and the generated-at footer vary per run, so those stay as format slots.
+_HTML_PREFIX = _minify_html("""
+    <!doctype html>
+    <html><head><meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+    body {
+        margin: 0; background: #f6f7f9; color: #1f2937;
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    }
+    .wrap { max-width: 720px; margin: 0 auto; padding: 24px 16px 40px; }
+    .hero {
+        background: #fff; border: 1px solid #e5e7eb; border-radius: 14px;
+        padding: 18px 20px 16px; margin-bottom: 12px;
+    }
+    .hero-header { margin: 0 0 6px; font-size: 17px; font-weight: 700; color: #111827; }
+    .hero-greeting { margin: 0 0 4px; font-size: 13px; color: #6b7280; }
+    .hero-headline { margin: 0; font-size: 15px; color: #1f2937; line-height: 1.55; }
+    .card {
+        background: #fff; border: 1px solid #e5e7eb; border-radius: 12px;
+        padding: 14px 16px; margin: 8px 0;
+    }
+    .art-title { font-size: 15px; font-weight: 600; line-height: 1.5; }
+    .art-title a { color: #0f766e; text-decoration: none; }
+    .badge {
+        display: inline-block; margin-left: 5px; padding: 1px 7px;
+        background: #fef3c7; color: #92400e; border-radius: 99px;
+        font-size: 11px; font-weight: 600; vertical-align: middle;
+    }
+    .art-title a:hover { text-decoration: underline; }
+    .art-summary { margin-top: 8px; font-size: 13px; color: #374151; line-height: 1.65; }
+    .foot { margin-top: 14px; color: #9ca3af; font-size: 11px; }
+    </style></head><body>
+    <div class="wrap">
+""")
+_HTML_HERO = (
+    '<div class="hero">'
+    '<p class="hero-header">{header}</p>'
+    '<p class="hero-greeting">뉴스레터 공유 드립니다.</p>'
+    '<p class="hero-headline">{headline}</p>'
+    '</div>'
+)
+_HTML_SUFFIX = '<div class="foot">Generated at (UTC): {generated}</div></div></body></html>'
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class NewsEntry:
     title: str
     link: str
     published_at: datetime
     source: str
     description: str = field(default="")
+    # Compacted title, computed once at construction; both newsletter
+    # builders render it, so it is not re-derived per render pass.
+    display_title: str = field(default="")
 
 
 def get_env(name: str, default: str | None = None, required: bool = False) -> str:
@@ -71,53 +158,165 @@ def parse_positive_int(name: str, raw: str, *, minimum: int = 1, maximum: int |
 
 
 def parse_entry_datetime(raw_entry: dict[str, Any]) -> datetime | None:
+    # feedparser has already parsed pubDate into a UTC struct_time; use it
+    # directly instead of re-parsing the raw string.
+    for key in ("published_parsed", "updated_parsed"):
+        pp = raw_entry.get(key)
+        if pp:
+            try:
+                return datetime(*pp[:6], tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                pass
+
     for key in ("published", "updated", "created"):
         raw = raw_entry.get(key)
         if not raw:
             continue
+        # RSS pubDate is RFC 822, which the stdlib parses in C; keep the
+        # heuristic dateutil parser only as a fallback for odd formats.
+        dt = None
         try:
-            dt = dt_parser.parse(raw)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:
-            continue
+            dt = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            pass
+        if dt is None:
+            try:
+                dt = dt_parser.parse(raw)
+            except Exception:
+                continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
     return None
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=256)
 def compact_title(title: str, max_chars: int = 90) -> str:
-    t = " ".join((title or "").split())
+    t = _WS_RE.sub(" ", title or "").strip()
     if len(t) <= max_chars:
         return t
     return t[: max_chars - 1].rstrip() + "…"
 
 
-def fetch_google_news(rss_url: str, keyword: str, max_items: int, hours_back: int) -> list[NewsEntry]:
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(hours=hours_back)
-    keyword_norm = keyword.strip().lower()
+def parse_feed(source: str | bytes) -> Any:
+    """Parse an RSS document (URL or raw XML) with fastfeedparser when available.
+
+    fastfeedparser (lxml-backed) is roughly an order of magnitude faster than
+    the pure-Python feedparser on Google News feeds and exposes the same
+    ``.entries`` shape. Any parse failure falls back to feedparser.
+    """
+    if fastfeedparser is not None:
+        try:
+            return fastfeedparser.parse(source)
+        except Exception:
+            pass
+    return feedparser.parse(source)
+
+
+# The KR and US fetches run concurrently and share one cache file; updates
+# must re-read under the lock so one feed's entry does not clobber the other's.
+_RSS_CACHE_LOCK = threading.Lock()
+
+
+def _load_rss_cache() -> dict[str, Any]:
+    try:
+        with open(RSS_CACHE_FILE, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_rss_cache(cache: dict[str, Any]) -> None:
+    if orjson is not None:
+        payload = orjson.dumps(cache)
+    else:
+        payload = json.dumps(cache, ensure_ascii=False).encode("utf-8")
+    try:
+        with open(RSS_CACHE_FILE, "wb") as f:
+            f.write(payload)
+    except OSError:
+        pass
+
+
+def _entry_to_cache(entry: NewsEntry) -> dict[str, str]:
+    return {
+        "title": entry.title,
+        "link": entry.link,
+        "published_at": entry.published_at.isoformat(),
+        "source": entry.source,
+        "description": entry.description,
+        "display_title": entry.display_title,
+    }
+
+
+def _entry_from_cache(raw: dict[str, str]) -> NewsEntry:
+    return NewsEntry(
+        title=raw["title"],
+        link=raw["link"],
+        published_at=datetime.fromisoformat(raw["published_at"]),
+        source=raw.get("source", ""),
+        description=raw.get("description", ""),
+        display_title=raw.get("display_title") or compact_title(raw["title"]),
+    )
+
+
+def _canonical_link(link: str) -> str:
+    """Normalize a link for dedup: drop utm_* query params and the fragment.
+
+    Google News regularly lists the same article under links differing only
+    in tracking parameters; keying the seen-set on the canonical form keeps
+    one copy. The original link is preserved on the entry for click-through.
+    """
+    try:
+        sp = urlsplit(link)
+    except ValueError:
+        return link
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(sp.query, keep_blank_values=True) if not k.startswith("utm_")]
+    )
+    return urlunsplit((sp.scheme, sp.netloc, sp.path, query, ""))
+
+
+def _extract_entries(feed: Any, keyword: str, cutoff: datetime) -> list[NewsEntry]:
+    keyword = keyword.strip()
+    keyword_cf = keyword.casefold()
+    cutoff_tuple = tuple(cutoff.utctimetuple())[:6]
     seen_links: set[str] = set()
 
     entries: list[NewsEntry] = []
-    feed = feedparser.parse(rss_url)
     for raw in feed.entries:
         title = (raw.get("title") or "").strip()
         if not title:
             continue
 
-        if keyword_norm and keyword_norm not in title.lower():
+        # Exact substring first: it is free for Hangul keywords (no case to
+        # fold) and usually hits for Latin ones, so title.casefold() only
+        # runs when the cheap check misses.
+        if keyword_cf and keyword not in title and keyword_cf not in title.casefold():
+            continue
+
+        # Reject stale entries on the pre-parsed struct_time before doing any
+        # datetime/link/source work; entries without the tuple fall through
+        # to the full parse below.
+        pp = raw.get("published_parsed") or raw.get("updated_parsed")
+        if pp and tuple(pp)[:6] < cutoff_tuple:
             continue
 
         published_at = parse_entry_datetime(raw)
         if not published_at:
             continue
-        if published_at < cutoff or published_at > now:
-            continue
 
         link = (raw.get("link") or "").strip()
-        if not link or link in seen_links:
+        if not link:
+            continue
+        canon = _canonical_link(link)
+        if canon in seen_links:
             continue
-        seen_links.add(link)
+        seen_links.add(canon)
 
         source = ""
         source_raw = raw.get("source")
@@ -133,11 +332,59 @@ def fetch_google_news(rss_url: str, keyword: str, max_items: int, hours_back: in
                 published_at=published_at,
                 source=source,
                 description=description,
+                display_title=compact_title(title),
             )
         )
 
-    entries.sort(key=lambda x: x.published_at.timestamp(), reverse=True)
-    return entries[:max_items]
+    return entries
+
+
+def _fetch_feed_entries(rss_url: str, keyword: str, cutoff: datetime) -> list[NewsEntry]:
+    """Download and parse one feed, using conditional GET where possible.
+
+    ETag/Last-Modified values and the parsed entries are persisted per URL in
+    RSS_CACHE_FILE; on HTTP 304 the cached entries are returned without
+    downloading or re-parsing the body. Entries older than ``cutoff`` are
+    dropped at extraction time, which is safe to cache: the window only moves
+    forward, so a 304 replay never needs entries an earlier run discarded.
+    """
+    with _RSS_CACHE_LOCK:
+        cached = _load_rss_cache().get(rss_url) or {}
+
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+
+    resp = _SESSION.get(rss_url, headers=headers, timeout=RSS_FETCH_TIMEOUT)
+    if resp.status_code == 304 and cached.get("entries") is not None:
+        return [_entry_from_cache(raw) for raw in cached["entries"]]
+    resp.raise_for_status()
+    etag = resp.headers.get("ETag")
+    modified = resp.headers.get("Last-Modified")
+
+    entries = _extract_entries(parse_feed(resp.content), keyword, cutoff)
+
+    with _RSS_CACHE_LOCK:
+        cache = _load_rss_cache()
+        cache[rss_url] = {
+            "etag": etag,
+            "modified": modified,
+            "entries": [_entry_to_cache(entry) for entry in entries],
+        }
+        _save_rss_cache(cache)
+    return entries
+
+
+def fetch_google_news(rss_url: str, keyword: str, max_items: int, hours_back: int) -> list[NewsEntry]:
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=hours_back)
+
+    entries = (e for e in _fetch_feed_entries(rss_url, keyword, cutoff) if cutoff <= e.published_at <= now)
+    # O(N log k) newest-first selection; Google News often returns more
+    # items than max_items, so this beats a full sort + slice.
+    return heapq.nlargest(max_items, entries, key=operator.attrgetter("published_at"))
 
 
 def _clean_text(raw: str) -> str:
@@ -174,13 +421,24 @@ def curate_articles(all_entries: list[NewsEntry]) -> dict[str, Any]:
     return {"headline": headline, "articles": articles}
 
 
-def build_newsletter_body(curated: dict[str, Any], all_entries: list[NewsEntry], today: datetime) -> str:
+@functools.lru_cache(maxsize=8)
+def newsletter_header(today: datetime) -> str:
+    """Format the '[yy.mm.dd (요일) ...]' line used as subject and header.
+
+    main and both body builders render it from the same timestamp, so the
+    strftime/weekday work is memoized on the datetime itself.
+    """
     weekday = WEEKDAY_KR[today.weekday()]
     date_str = today.strftime("%y.%m.%d")
-    header = f"[{date_str} ({weekday}) 스테이블코인 Newsletter]"
+    return f"[{date_str} ({weekday}) 스테이블코인 Newsletter]"
+
+
+def build_newsletter_body(curated: dict[str, Any], all_entries: list[NewsEntry], today: datetime) -> str:
+    header = newsletter_header(today)
     headline = curated.get("headline", "")
 
-    lines = [header, "뉴스레터 공유 드립니다.", headline, ""]
+    out = io.StringIO()
+    out.write(f"{header}\n뉴스레터 공유 드립니다.\n{headline}\n\n")
 
     for seq, item in enumerate(curated.get("articles", []), 1):
         idx = item.get("index", 0)
@@ -190,89 +448,129 @@ def build_newsletter_body(curated: dict[str, Any], all_entries: list[NewsEntry],
         dup = item.get("duplicate_count", 1)
         dup_part = f" ({dup}건)" if dup and dup > 1 else ""
         source_part = f" | {e.source}" if e.source else ""
-        lines.append(f"{seq}. {compact_title(e.title)}{dup_part} ({e.link}{source_part})")
-        lines.append(f"   | {item.get('summary', '')}")
-        lines.append("")
+        out.write(f"{seq}. {e.display_title}{dup_part} ({e.link}{source_part})\n")
+        out.write(f"   | {item.get('summary', '')}\n\n")
+
+    out.write(f"Generated at (UTC): {today.isoformat()}")
+    return out.getvalue()
+
 
-    lines.append(f"Generated at (UTC): {today.isoformat()}")
-    return "\n".join(lines)
+# Titles, links, and source names repeat across the KR/US passes (and across
+# runs); memoize their escaping. One-off strings keep plain html.escape.
+_escape = functools.lru_cache(maxsize=512)(html.escape)
 
 
 def build_newsletter_html(curated: dict[str, Any], all_entries: list[NewsEntry], today: datetime) -> str:
-    weekday = WEEKDAY_KR[today.weekday()]
-    date_str = today.strftime("%y.%m.%d")
-    header = html.escape(f"[{date_str} ({weekday}) 스테이블코인 Newsletter]")
+    header = html.escape(newsletter_header(today))
     headline = html.escape(curated.get("headline", ""))
 
-    rows: list[str] = []
+    parts: list[str] = [_HTML_PREFIX, _HTML_HERO.format(header=header, headline=headline)]
+
+    article_count = 0
     for seq, item in enumerate(curated.get("articles", []), 1):
         idx = item.get("index", 0)
         if idx < 1 or idx > len(all_entries):
             continue
         e = all_entries[idx - 1]
-        title = html.escape(compact_title(e.title))
-        link = html.escape(e.link)
+        title = _escape(e.display_title)
+        link = _escape(e.link)
         dup = item.get("duplicate_count", 1)
         dup_badge = f' <span class="badge">{dup}건</span>' if dup and dup > 1 else ""
-        source_part = f' | {html.escape(e.source)}' if e.source else ""
+        source_part = f' | {_escape(e.source)}' if e.source else ""
         summary = html.escape(item.get("summary", ""))
-        rows.append(
+        parts.append(
             '<article class="card">'
             f'<div class="art-title">{seq}. <a href="{link}">{title}</a>{dup_badge}{source_part}</div>'
             f'<div class="art-summary">| {summary}</div>'
             "</article>"
         )
+        article_count += 1
 
-    if not rows:
-        rows.append('<article class="card"><div class="art-title">오늘은 조건에 맞는 기사가 없습니다.</div></article>')
+    if not article_count:
+        parts.append('<article class="card"><div class="art-title">오늘은 조건에 맞는 기사가 없습니다.</div></article>')
 
     generated = html.escape(today.isoformat())
-    return (
-        '<!doctype html>'
-        '<html><head><meta charset="utf-8">'
-        '<meta name="viewport" content="width=device-width, initial-scale=1">'
-        '<style>'
-        'body{margin:0;background:#f6f7f9;color:#1f2937;font-family:-apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,sans-serif;}'
-        '.wrap{max-width:720px;margin:0 auto;padding:24px 16px 40px;}'
-        '.hero{background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:18px 20px 16px;margin-bottom:12px;}'
-        '.hero-header{margin:0 0 6px;font-size:17px;font-weight:700;color:#111827;}'
-        '.hero-greeting{margin:0 0 4px;font-size:13px;color:#6b7280;}'
-        '.hero-headline{margin:0;font-size:15px;color:#1f2937;line-height:1.55;}'
-        '.card{background:#fff;border:1px solid #e5e7eb;border-radius:12px;padding:14px 16px;margin:8px 0;}'
-        '.art-title{font-size:15px;font-weight:600;line-height:1.5;}'
-        '.art-title a{color:#0f766e;text-decoration:none;}'
-        '.badge{display:inline-block;margin-left:5px;padding:1px 7px;background:#fef3c7;color:#92400e;border-radius:99px;font-size:11px;font-weight:600;vertical-align:middle;}'
-        '.art-title a:hover{text-decoration:underline;}'
-        '.art-summary{margin-top:8px;font-size:13px;color:#374151;line-height:1.65;}'
-        '.foot{margin-top:14px;color:#9ca3af;font-size:11px;}'
-        '</style></head><body>'
-        '<div class="wrap">'
-        '<div class="hero">'
-        f'<p class="hero-header">{header}</p>'
-        '<p class="hero-greeting">뉴스레터 공유 드립니다.</p>'
-        f'<p class="hero-headline">{headline}</p>'
-        '</div>'
-        + "".join(rows)
-        + f'<div class="foot">Generated at (UTC): {generated}</div>'
-        '</div></body></html>'
+    parts.append(_HTML_SUFFIX.format(generated=generated))
+    return "".join(parts)
+
+
+# Parts are base64-encoded, whose alphabet contains no "-", so a delimiter
+# line can never occur inside a body.
+_MIME_BOUNDARY = "stablecoin-digest-alt"
+
+
+def _b64_mime(text: str) -> str:
+    data = base64.b64encode(text.encode("utf-8")).decode("ascii")
+    return "\r\n".join(data[i:i + 76] for i in range(0, len(data), 76))
+
+
+def _encode_header(value: str) -> str:
+    if value.isascii():
+        return value
+    return "=?utf-8?B?" + base64.b64encode(value.encode("utf-8")).decode("ascii") + "?="
+
+
+def build_raw_message(sender: str, to_email: str, subject: str, body: str, html_body: str) -> bytes:
+    """Assemble the multipart/alternative message bytes directly.
+
+    The email.mime generator walks a pure-Python object graph (header
+    folding, boundary bookkeeping, CTE encoding) for what is here a fixed
+    two-part layout; emitting the bytes by hand skips all of that.
+    """
+    msg = (
+        f"To: {to_email}\r\n"
+        f"From: {sender}\r\n"
+        f"Subject: {_encode_header(subject)}\r\n"
+        "MIME-Version: 1.0\r\n"
+        f'Content-Type: multipart/alternative; boundary="{_MIME_BOUNDARY}"\r\n'
+        "\r\n"
+        f"--{_MIME_BOUNDARY}\r\n"
+        'Content-Type: text/plain; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n"
+        "\r\n"
+        f"{_b64_mime(body)}\r\n"
+        f"--{_MIME_BOUNDARY}\r\n"
+        'Content-Type: text/html; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n"
+        "\r\n"
+        f"{_b64_mime(html_body)}\r\n"
+        f"--{_MIME_BOUNDARY}--\r\n"
     )
+    return msg.encode("ascii")
 
 
-def send_gmail(sender: str, to_email: str, subject: str, body: str, html_body: str) -> None:
+def open_smtp_session(sender: str) -> smtplib.SMTP:
+    """Connect, STARTTLS, and log in once; the caller owns the session."""
     app_password = get_env("GMAIL_APP_PASSWORD", required=True)
 
-    msg = MIMEMultipart("alternative")
-    msg["to"] = to_email
-    msg["from"] = sender
-    msg["subject"] = subject
-    msg.attach(MIMEText(body, "plain", "utf-8"))
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
-
-    with smtplib.SMTP(GMAIL_SMTP_HOST, GMAIL_SMTP_PORT) as smtp:
+    smtp = smtplib.SMTP(GMAIL_SMTP_HOST, GMAIL_SMTP_PORT)
+    try:
         smtp.ehlo()
         smtp.starttls()
         smtp.login(sender, app_password)
-        smtp.sendmail(sender, to_email, msg.as_string())
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+def send_gmail(sender: str, messages: list[tuple[str, str, str, str]], smtp: smtplib.SMTP | None = None) -> None:
+    """Send all (to_email, subject, body, html_body) messages in one SMTP session.
+
+    An already-authenticated session may be passed in and is left open for
+    the caller; otherwise one is opened (and closed) here. Either way the
+    TLS handshake and login happen at most once per call.
+    """
+    owned = smtp is None
+    if owned:
+        smtp = open_smtp_session(sender)
+    try:
+        for to_email, subject, body, html_body in messages:
+            raw = build_raw_message(sender, to_email, subject, body, html_body)
+            smtp.sendmail(sender, to_email, raw)
+    finally:
+        if owned:
+            smtp.quit()
 
 
 def validate_configuration() -> dict[str, Any]:
@@ -303,7 +601,7 @@ def validate_configuration() -> dict[str, Any]:
     }
 
 
-def main() -> None:
+async def main() -> None:
     load_dotenv()
 
     config = validate_configuration()
@@ -317,22 +615,25 @@ def main() -> None:
         print(f"Configuration valid for {config['task_name']}: to={to_email}, hours_back={hours_back}, max_items={max_items}")
         return
 
-    kr_entries = fetch_google_news(
-        rss_url=config["rss_url_kr"], keyword=KEYWORD_KR, max_items=max_items, hours_back=hours_back
-    )
-    us_entries = fetch_google_news(
-        rss_url=config["rss_url_us"], keyword=KEYWORD_US, max_items=max_items, hours_back=hours_back
+    # Both feeds are I/O-bound; overlap them instead of fetching serially.
+    kr_entries, us_entries = await asyncio.gather(
+        asyncio.to_thread(
+            fetch_google_news,
+            rss_url=config["rss_url_kr"], keyword=KEYWORD_KR, max_items=max_items, hours_back=hours_back,
+        ),
+        asyncio.to_thread(
+            fetch_google_news,
+            rss_url=config["rss_url_us"], keyword=KEYWORD_US, max_items=max_items, hours_back=hours_back,
+        ),
     )
 
     all_entries = kr_entries + us_entries
-    all_entries.sort(key=lambda x: x.published_at.timestamp(), reverse=True)
+    all_entries.sort(key=operator.attrgetter("published_at"), reverse=True)
 
     print(f"Fetched {len(kr_entries)} KR + {len(us_entries)} US = {len(all_entries)} total articles")
 
     today = datetime.now(timezone.utc)
-    weekday = WEEKDAY_KR[today.weekday()]
-    date_str = today.strftime("%y.%m.%d")
-    subject = f"[{date_str} ({weekday}) 스테이블코인 Newsletter]"
+    subject = newsletter_header(today)
 
     if not all_entries:
         body = f"{subject}\n\n오늘은 조건에 맞는 기사가 없습니다."
@@ -340,7 +641,7 @@ def main() -> None:
             f'<!doctype html><html><body><p>{html.escape(subject)}</p>'
             '<p>오늘은 조건에 맞는 기사가 없습니다.</p></body></html>'
         )
-        send_gmail(sender=from_email, to_email=to_email, subject=subject, body=body, html_body=html_body)
+        await asyncio.to_thread(send_gmail, from_email, [(to_email, subject, body, html_body)])
         print("No articles found — sent empty notification")
         return
 
@@ -348,10 +649,10 @@ def main() -> None:
     body = build_newsletter_body(curated, all_entries, today)
     html_body = build_newsletter_html(curated, all_entries, today)
 
-    send_gmail(sender=from_email, to_email=to_email, subject=subject, body=body, html_body=html_body)
+    await asyncio.to_thread(send_gmail, from_email, [(to_email, subject, body, html_body)])
     n = len(curated.get("articles", []))
     print(f"Sent newsletter ({n} curated articles from {len(all_entries)} total) to {to_email}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())